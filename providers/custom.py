@@ -1,12 +1,12 @@
 """Custom API provider implementation."""
 
+import dataclasses
 import logging
 import os
 from typing import Optional
 
 from .base import (
     ModelCapabilities,
-    ModelResponse,
     ProviderType,
     RangeTemperatureConstraint,
 )
@@ -128,9 +128,8 @@ class CustomProvider(OpenAICompatibleProvider):
         capabilities = self._registry.get_capabilities(model_name)
 
         if capabilities:
-            # Update provider type to CUSTOM
-            capabilities.provider = ProviderType.CUSTOM
-            return capabilities
+            # Update provider type to CUSTOM on a copy; registry capabilities are shared
+            return dataclasses.replace(capabilities, provider=ProviderType.CUSTOM)
         else:
             # Resolve any potential aliases and create generic capabilities
             resolved_name = self._resolve_model_name(model_name)
@@ -222,41 +221,6 @@ class CustomProvider(OpenAICompatibleProvider):
         logging.debug(f"Model '{model_name}' rejected by custom provider (appears to be cloud model)")
         return False
 
-    def generate_content(
-        self,
-        prompt: str,
-        model_name: str,
-        system_prompt: Optional[str] = None,
-        temperature: float = 0.7,
-        max_output_tokens: Optional[int] = None,
-        **kwargs,
-    ) -> ModelResponse:
-        """Generate content using the custom API.
-
-        Args:
-            prompt: User prompt to send to the model
-            model_name: Name of the model to use
-            system_prompt: Optional system prompt for model behavior
-            temperature: Sampling temperature
-            max_output_tokens: Maximum tokens to generate
-            **kwargs: Additional provider-specific parameters
-
-        Returns:
-            ModelResponse with generated content and metadata
-        """
-        # Resolve model alias to actual model name
-        resolved_model = self._resolve_model_name(model_name)
-
-        # Call parent method with resolved model name
-        return super().generate_content(
-            prompt=prompt,
-            model_name=resolved_model,
-            system_prompt=system_prompt,
-            temperature=temperature,
-            max_output_tokens=max_output_tokens,
-            **kwargs,
-        )
-
     def supports_thinking_mode(self, model_name: str) -> bool:
         """Check if the model supports extended thinking mode.
 
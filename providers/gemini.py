@@ -43,6 +43,12 @@ class GeminiModelProvider(ModelProvider):
         super().__init__(api_key, **kwargs)
         self._client = None
         self._token_counters = {}  # Cache for token counting
+        # Shorthand entries alias full model names and have no capabilities of their own
+        self._capabilities = {
+            name: self._build_capabilities(name, config)
+            for name, config in self.SUPPORTED_MODELS.items()
+            if isinstance(config, dict)
+        }
 
     @property
     def client(self):
@@ -51,22 +57,14 @@ class GeminiModelProvider(ModelProvider):
             self._client = genai.Client(api_key=self.api_key)
         return self._client
 
-    def get_capabilities(self, model_name: str) -> ModelCapabilities:
-        """Get capabilities for a specific Gemini model."""
-        # Resolve shorthand
-        resolved_name = self._resolve_model_name(model_name)
-
-        if resolved_name not in self.SUPPORTED_MODELS:
-            raise ValueError(f"Unsupported Gemini model: {model_name}")
-
-        config = self.SUPPORTED_MODELS[resolved_name]
-
+    def _build_capabilities(self, model_name: str, config: dict) -> ModelCapabilities:
+        """Build the capabilities for a supported Gemini model."""
         # Gemini models support 0.0-2.0 temperature range
         temp_constraint = RangeTemperatureConstraint(0.0, 2.0, 0.7)
 
         return ModelCapabilities(
             provider=ProviderType.GOOGLE,
-            model_name=resolved_name,
+            model_name=model_name,
             friendly_name="Gemini",
             context_window=config["context_window"],
             supports_extended_thinking=config["supports_extended_thinking"],
@@ -76,6 +74,16 @@ class GeminiModelProvider(ModelProvider):
             temperature_constraint=temp_constraint,
         )
 
+    def get_capabilities(self, model_name: str) -> ModelCapabilities:
+        """Get capabilities for a specific Gemini model."""
+        # Resolve shorthand
+        resolved_name = self._resolve_model_name(model_name)
+
+        try:
+            return self._capabilities[resolved_name]
+        except KeyError:
+            raise ValueError(f"Unsupported Gemini model: {model_name}")
+
     def generate_content(
         self,
         prompt: str,
@@ -111,8 +119,8 @@ class GeminiModelProvider(ModelProvider):
         capabilities = self.get_capabilities(resolved_name)
         if capabilities.supports_extended_thinking and thinking_mode in self.THINKING_BUDGETS:
             # Get model's max thinking tokens and calculate actual budget
-            model_config = self.SUPPORTED_MODELS.get(resolved_name)
-            if model_config and "max_thinking_tokens" in model_config:
+            model_config = self.SUPPORTED_MODELS[resolved_name]
+            if "max_thinking_tokens" in model_config:
                 max_thinking_tokens = model_config["max_thinking_tokens"]
                 actual_thinking_budget = int(max_thinking_tokens * self.THINKING_BUDGETS[thinking_mode])
                 generation_config.thinking_config = types.ThinkingConfig(thinking_budget=actual_thinking_budget)
@@ -162,8 +170,8 @@ class GeminiModelProvider(ModelProvider):
 
     def validate_model_name(self, model_name: str) -> bool:
         """Validate if the model name is supported."""
-        resolved_name = self._resolve_model_name(model_name)
-        return resolved_name in self.SUPPORTED_MODELS and isinstance(self.SUPPORTED_MODELS[resolved_name], dict)
+        # Shorthands resolve to full names, and only full names have capabilities
+        return self._resolve_model_name(model_name) in self._capabilities
 
     def supports_thinking_mode(self, model_name: str) -> bool:
         """Check if the model supports extended thinking mode."""
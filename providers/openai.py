@@ -1,12 +1,21 @@
 """OpenAI model provider implementation."""
 
+import io
+import logging
+import time
+from typing import Optional, Union
+
+from openai import NOT_GIVEN
+from openai.types.chat import ChatCompletion
+
 from .base import (
     FixedTemperatureConstraint,
     ModelCapabilities,
+    ModelResponse,
     ProviderType,
     RangeTemperatureConstraint,
 )
-from .openai_compatible import OpenAICompatibleProvider
+from .openai_compatible import OpenAICompatibleProvider, _json_dumps, _json_loads
 
 
 class OpenAIModelProvider(OpenAICompatibleProvider):
@@ -24,19 +33,21 @@ class OpenAIModelProvider(OpenAICompatibleProvider):
         },
     }
 
+    # Batch API statuses after which a batch will not change any more
+    BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
     def __init__(self, api_key: str, **kwargs):
         """Initialize OpenAI provider with API key."""
         # Set default OpenAI base URL, allow override for regions/custom endpoints
         kwargs.setdefault("base_url", "https://api.openai.com/v1")
         super().__init__(api_key, **kwargs)
 
-    def get_capabilities(self, model_name: str) -> ModelCapabilities:
-        """Get capabilities for a specific OpenAI model."""
-        if model_name not in self.SUPPORTED_MODELS:
-            raise ValueError(f"Unsupported OpenAI model: {model_name}")
-
-        config = self.SUPPORTED_MODELS[model_name]
+        self._capabilities = {
+            name: self._build_capabilities(name, config) for name, config in self.SUPPORTED_MODELS.items()
+        }
 
+    def _build_capabilities(self, model_name: str, config: dict) -> ModelCapabilities:
+        """Build the capabilities for a supported OpenAI model."""
         # Define temperature constraints per model
         if model_name in ["o3", "o3-mini"]:
             # O3 models only support temperature=1.0
@@ -57,16 +68,147 @@ class OpenAIModelProvider(OpenAICompatibleProvider):
             temperature_constraint=temp_constraint,
         )
 
+    def get_capabilities(self, model_name: str) -> ModelCapabilities:
+        """Get capabilities for a specific OpenAI model."""
+        try:
+            return self._capabilities[model_name]
+        except KeyError:
+            raise ValueError(f"Unsupported OpenAI model: {model_name}")
+
     def get_provider_type(self) -> ProviderType:
         """Get the provider type."""
         return ProviderType.OPENAI
 
     def validate_model_name(self, model_name: str) -> bool:
         """Validate if the model name is supported."""
-        return model_name in self.SUPPORTED_MODELS
+        return model_name in self._capabilities
 
     def supports_thinking_mode(self, model_name: str) -> bool:
         """Check if the model supports extended thinking mode."""
         # Currently no OpenAI models support extended thinking
         # This may change with future O3 models
         return False
+
+    def submit_batch(self, requests: list[dict], completion_window: str = "24h") -> str:
+        """Submit requests to the OpenAI Batch API for offline processing.
+
+        Batch jobs complete within the completion window at a lower price than
+        synchronous requests, which suits non-interactive bulk work.
+
+        Args:
+            requests: List of keyword-argument dicts as accepted by generate_content
+                (``prompt``, ``model_name``, ...). An optional ``custom_id`` key
+                identifies each request in the results; defaults to its index.
+            completion_window: Time frame within which the batch should be processed
+
+        Returns:
+            ID of the created batch
+        """
+        lines = []
+        models = set()
+        for index, request in enumerate(requests):
+            request = dict(request)
+            custom_id = str(request.pop("custom_id", index))
+            body = self._build_completion_params(**request)
+            body.pop("stream", None)
+            models.add(body["model"])
+            self._check_context_window(
+                request["prompt"], body["model"], request.get("system_prompt"), request.get("max_output_tokens")
+            )
+            lines.append(
+                _json_dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body})
+            )
+
+        batch_file = io.BytesIO(b"\n".join(lines))
+        uploaded = self.client.files.create(file=("batch.jsonl", batch_file), purpose="batch")
+        # Record a shared model on the batch so retrieval need not download the input file for it
+        batch = self.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window=completion_window,
+            metadata={"model": models.pop()} if len(models) == 1 else NOT_GIVEN,
+        )
+
+        logging.info(f"Submitted OpenAI batch {batch.id} with {len(lines)} requests")
+        return batch.id
+
+    def retrieve_batch_results(
+        self,
+        batch_id: str,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 300.0,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Union[ModelResponse, dict]]:
+        """Wait for a batch to finish and download its results.
+
+        Polls with exponential backoff, starting at ``poll_interval`` seconds and
+        doubling up to ``max_poll_interval``. Batches submitted with more than one
+        model also download their input file, to map results back to requested models.
+
+        Args:
+            batch_id: ID returned by submit_batch
+            poll_interval: Initial delay between status checks in seconds
+            max_poll_interval: Upper bound for the delay between status checks
+            timeout: Maximum seconds to wait, or None to wait until the batch finishes
+
+        Returns:
+            Mapping of custom_id to a ModelResponse (with the requested model as
+            ``model_name`` and the served snapshot in ``metadata["model"]``), or to the
+            error dict reported by the API for requests that failed
+
+        Raises:
+            TimeoutError: If the batch has not finished within ``timeout``
+            RuntimeError: If the batch failed, expired or was cancelled without output
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        delay = poll_interval
+
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status in self.BATCH_TERMINAL_STATUSES:
+                break
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise TimeoutError(f"OpenAI batch {batch_id} still {batch.status} after {timeout}s")
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+
+        if not batch.output_file_id and not batch.error_file_id:
+            raise RuntimeError(f"OpenAI batch {batch_id} finished with status '{batch.status}' and no output")
+
+        # Output records carry the dated snapshot name (e.g. o3-mini-2025-01-31); report the
+        # requested model like the synchronous path does. Single-model batches record it in
+        # their metadata; otherwise the input file is downloaded once, on the first success.
+        requested_model = (batch.metadata or {}).get("model")
+        requested_models = None
+
+        results = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).content.splitlines():
+                if not line.strip():
+                    continue
+                record = _json_loads(line)
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    results[record["custom_id"]] = record.get("error") or response.get("body") or {}
+                    continue
+                completion = ChatCompletion.model_validate(response["body"])
+                if requested_model is not None:
+                    model_name = requested_model
+                else:
+                    if requested_models is None:
+                        requested_models = self._read_batch_models(batch.input_file_id)
+                    model_name = requested_models.get(record["custom_id"], completion.model)
+                results[record["custom_id"]] = self._parse_response(completion, model_name)
+
+        return results
+
+    def _read_batch_models(self, input_file_id: str) -> dict[str, str]:
+        """Download a batch input file and map each custom_id to its requested model."""
+        requested_models = {}
+        for line in self.client.files.content(input_file_id).content.splitlines():
+            if line.strip():
+                request = _json_loads(line)
+                requested_models[request["custom_id"]] = request["body"]["model"]
+        return requested_models
@@ -1,13 +1,28 @@
 """Base class for OpenAI-compatible API providers."""
 
+import asyncio
+import contextlib
+import dataclasses
+import functools
+import hashlib
+import importlib.util
 import ipaddress
+import json
 import logging
 import os
+import threading
 from abc import abstractmethod
+from collections.abc import MutableMapping
 from typing import Optional
 from urllib.parse import urlparse
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+try:
+    import orjson
+except ImportError:  # Optional speedup for JSON (de)serialization
+    orjson = None
 
 from .base import (
     ModelCapabilities,
@@ -16,6 +31,105 @@ from .base import (
     ProviderType,
 )
 
+# Extra generate_content kwargs passed through to chat.completions.create
+_FORWARDED_KWARGS = frozenset({"top_p", "frequency_penalty", "presence_penalty", "seed", "stop", "stream"})
+
+# Process-wide cache of sync OpenAI clients so that provider instances talking to the
+# same endpoint with the same credentials share one client and its connection pool.
+_CLIENT_CACHE: dict[tuple, OpenAI] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _json_dumps(obj, sort_keys: bool = False) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when it is installed.
+
+    Both paths produce the same bytes for the same data. Values JSON cannot
+    represent are serialized with ``str()``.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, sort_keys=sort_keys, default=str, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _hash_api_key(api_key: Optional[str]) -> str:
+    """Hash an API key so raw credentials are never held in a cache key."""
+    return hashlib.sha256((api_key or "").encode()).hexdigest()
+
+
+def _client_cache_key(client_kwargs: dict, http2: bool = False) -> tuple:
+    """Build a hashable cache key for a set of OpenAI client arguments."""
+    timeout = client_kwargs.get("timeout")
+    return (
+        client_kwargs.get("base_url"),
+        client_kwargs.get("organization"),
+        _hash_api_key(client_kwargs.get("api_key")),
+        tuple(sorted((client_kwargs.get("default_headers") or {}).items())),
+        (timeout.connect, timeout.read, timeout.write, timeout.pool) if timeout is not None else None,
+        id(client_kwargs["http_client"]) if "http_client" in client_kwargs else None,
+        client_kwargs.get("max_retries"),
+        http2,
+    )
+
+
+@functools.cache
+def _http2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@functools.cache
+def _tiktoken():
+    """Import tiktoken once, returning None if it is not installed.
+
+    tiktoken is optional; caching the result avoids re-running the import machinery
+    (and a full sys.path scan when it is missing) on every token count.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken
+
+
+@functools.cache
+def _tiktoken_encoding(model_name: str):
+    """Return the exact tiktoken encoding for a model, or None if it is not known.
+
+    Cached per model name, since building an encoding loads its BPE ranks. The first
+    load may download those ranks; any failure is cached as None so callers fall back
+    instead of retrying the download on every request.
+    """
+    tiktoken = _tiktoken()
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return None
+    except Exception as e:
+        logging.debug(f"Failed to load tiktoken encoding for {model_name}: {e}")
+        return None
+
+
+@functools.cache
+def _default_tiktoken_encoding():
+    """Return the generic cl100k_base encoding, or None if it cannot be loaded."""
+    tiktoken = _tiktoken()
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logging.debug(f"Failed to load tiktoken cl100k_base encoding: {e}")
+        return None
+
 
 class OpenAICompatibleProvider(ModelProvider):
     """Base class for any provider using an OpenAI-compatible API.
@@ -28,6 +142,7 @@ class OpenAICompatibleProvider(ModelProvider):
 
     DEFAULT_HEADERS = {}
     FRIENDLY_NAME = "OpenAI Compatible"
+    DEFAULT_MAX_RETRIES = 2  # Same as the OpenAI SDK default: 3 attempts in total
 
     def __init__(self, api_key: str, base_url: str = None, **kwargs):
         """Initialize the provider with API key and optional base URL.
@@ -35,17 +150,33 @@ class OpenAICompatibleProvider(ModelProvider):
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API endpoint
-            **kwargs: Additional configuration options including timeout
+            **kwargs: Additional configuration options including timeout, an
+                optional shared ``http_client`` (httpx.Client) for the sync client,
+                ``http2`` to multiplex requests over one connection (requires h2),
+                ``warmup`` to open the connection in the background at startup and
+                ``cache``, a mutable mapping used to reuse responses to deterministic
+                requests (temperature 0 or a fixed seed)
         """
         super().__init__(api_key, **kwargs)
         self._client = None
+        self._async_client = None
+        self._async_client_loop = None
         self.base_url = base_url
         self.organization = kwargs.get("organization")
+        self.http_client = kwargs.get("http_client")
+        self.response_cache: Optional[MutableMapping] = kwargs.get("cache")
+        self._response_cache_lock = threading.Lock()
+        self.http2 = self._configure_http2(kwargs.get("http2", os.getenv("CUSTOM_HTTP2", "false")))
         self.allowed_models = self._parse_allowed_models()
 
         # Configure timeouts - especially important for custom/local endpoints
         self.timeout_config = self._configure_timeouts(**kwargs)
 
+        # Retries for transient failures (rate limits, timeouts, connection errors, 5xx).
+        # The OpenAI client retries these with exponential backoff and jitter, honoring
+        # Retry-After; permanent errors such as 400/401 are never retried.
+        self.max_retries = int(kwargs.get("max_retries", os.getenv("CUSTOM_MAX_RETRIES", self.DEFAULT_MAX_RETRIES)))
+
         # Validate base URL for security
         if self.base_url:
             self._validate_base_url()
@@ -57,6 +188,21 @@ class OpenAICompatibleProvider(ModelProvider):
                 "This may be insecure. Consider setting an API key for authentication."
             )
 
+        # Optionally prime the connection pool so the first real request skips the
+        # DNS/TCP/TLS handshake
+        if kwargs.get("warmup", False):
+            threading.Thread(target=self._warm_connection, name=f"{self.FRIENDLY_NAME} warmup", daemon=True).start()
+
+    def _warm_connection(self) -> None:
+        """Create the client and issue a cheap request to open a pooled connection.
+
+        Runs in a background thread; any failure is ignored since the real request
+        will simply establish its own connection.
+        """
+        with contextlib.suppress(Exception):
+            self.client.with_options(timeout=2.0).models.list()
+            logging.debug(f"Warmed up connection to {self.base_url or 'default endpoint'}")
+
     def _parse_allowed_models(self) -> Optional[set[str]]:
         """Parse allowed models from environment variable.
 
@@ -84,6 +230,26 @@ class OpenAICompatibleProvider(ModelProvider):
 
         return None
 
+    def _configure_http2(self, setting) -> bool:
+        """Decide whether to use HTTP/2 for this provider's connections.
+
+        HTTP/2 lets concurrent requests share a single TLS connection instead of
+        opening one socket per in-flight request. It needs the optional h2 package
+        (``pip install httpx[http2]``); without it, HTTP/1.1 is used.
+
+        Args:
+            setting: Requested value, either a bool or a "true"/"false" string
+
+        Returns:
+            True if HTTP/2 was requested and is available
+        """
+        if isinstance(setting, str):
+            setting = setting.strip().lower() in ("true", "1", "yes")
+        if setting and not _http2_available():
+            logging.warning(f"HTTP/2 requested for {self.FRIENDLY_NAME} but h2 is not installed - using HTTP/1.1")
+            return False
+        return bool(setting)
+
     def _configure_timeouts(self, **kwargs):
         """Configure timeout settings based on provider type and custom settings.
 
@@ -95,8 +261,6 @@ class OpenAICompatibleProvider(ModelProvider):
         Returns:
             httpx.Timeout object with appropriate timeout settings
         """
-        import httpx
-
         # Default timeouts - more generous for custom/local endpoints
         default_connect = 30.0  # 30 seconds for connection (vs OpenAI's 5s)
         default_read = 600.0  # 10 minutes for reading (same as OpenAI default)
@@ -195,34 +359,160 @@ class OpenAICompatibleProvider(ModelProvider):
                 raise
             raise ValueError(f"Invalid base URL '{self.base_url}': {str(e)}")
 
+    def _client_kwargs(self) -> dict:
+        """Build the keyword arguments shared by the sync and async OpenAI clients."""
+        client_kwargs = {
+            "api_key": self.api_key,
+        }
+
+        if self.base_url:
+            client_kwargs["base_url"] = self.base_url
+
+        if self.organization:
+            client_kwargs["organization"] = self.organization
+
+        # Add default headers if any
+        if self.DEFAULT_HEADERS:
+            client_kwargs["default_headers"] = self.DEFAULT_HEADERS.copy()
+
+        # Add configured timeout settings
+        if hasattr(self, "timeout_config") and self.timeout_config:
+            client_kwargs["timeout"] = self.timeout_config
+            logging.debug(f"OpenAI client initialized with custom timeout: {self.timeout_config}")
+
+        client_kwargs["max_retries"] = self.max_retries
+
+        return client_kwargs
+
     @property
     def client(self):
-        """Lazy initialization of OpenAI client with security checks and timeout configuration."""
+        """Lazy initialization of OpenAI client with security checks and timeout configuration.
+
+        Clients are shared process-wide between provider instances with the same
+        endpoint, credentials and settings, so re-creating a provider reuses the
+        existing connection pool instead of paying a fresh TCP/TLS handshake.
+        """
         if self._client is None:
-            client_kwargs = {
-                "api_key": self.api_key,
-            }
+            client_kwargs = self._client_kwargs()
+            if self.http_client is not None:
+                client_kwargs["http_client"] = self.http_client
+
+            key = _client_cache_key(client_kwargs, self.http2)
+            with _CLIENT_CACHE_LOCK:
+                client = _CLIENT_CACHE.get(key)
+                if client is None:
+                    if self.http2 and "http_client" not in client_kwargs:
+                        client_kwargs["http_client"] = httpx.Client(
+                            http2=True, timeout=self.timeout_config, follow_redirects=True
+                        )
+                    client = OpenAI(**client_kwargs)
+                    _CLIENT_CACHE[key] = client
+            self._client = client
+
+        return self._client
+
+    @property
+    def async_client(self):
+        """Lazy initialization of the async OpenAI client used for concurrent requests.
+
+        The client's connection pool is bound to the event loop it was first used on,
+        while provider instances live for the whole process. The client is therefore
+        rebuilt whenever it is requested from a different event loop, so repeated
+        ``asyncio.run(...)`` calls each get a working client.
+
+        A replaced client is dropped without being closed: its connections can only be
+        closed on its own loop, which is usually closed by then. Callers that run
+        requests in a short-lived loop (e.g. ``asyncio.run``) own the client's lifecycle
+        and should ``await provider.aclose()`` before that loop ends.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if self._async_client is None or self._async_client_loop is not loop:
+            client_kwargs = self._client_kwargs()
+            if self.http2:
+                client_kwargs["http_client"] = httpx.AsyncClient(
+                    http2=True, timeout=self.timeout_config, follow_redirects=True
+                )
+            self._async_client = AsyncOpenAI(**client_kwargs)
+            self._async_client_loop = loop
 
-            if self.base_url:
-                client_kwargs["base_url"] = self.base_url
+        return self._async_client
 
-            if self.organization:
-                client_kwargs["organization"] = self.organization
+    async def aclose(self) -> None:
+        """Close the async client and its connections.
 
-            # Add default headers if any
-            if self.DEFAULT_HEADERS:
-                client_kwargs["default_headers"] = self.DEFAULT_HEADERS.copy()
+        Must be awaited on the event loop the client was used on. A new client is
+        created on the next async request.
+        """
+        client = self._async_client
+        self._async_client = self._async_client_loop = None
+        if client is not None:
+            await client.close()
+
+    def _resolve_model_name(self, model_name: str) -> str:
+        """Resolve a model alias to the name sent to the API.
 
-            # Add configured timeout settings
-            if hasattr(self, "timeout_config") and self.timeout_config:
-                client_kwargs["timeout"] = self.timeout_config
-                logging.debug(f"OpenAI client initialized with custom timeout: {self.timeout_config}")
+        Providers with alias registries override this; by default names are used as-is.
+        """
+        return model_name
+
+    def _context_window_budget(
+        self, prompt: str, model_name: str, system_prompt: Optional[str], max_output_tokens: Optional[int]
+    ) -> Optional[int]:
+        """Return the prompt token budget if the prompt needs tokenizing to check it.
+
+        Returns None when no check applies: tiktoken does not know the model's exact
+        tokenizer, the model only has generic capabilities (so estimates never reject
+        a prompt the API would have accepted), or the prompt is provably small enough.
+        A token always covers at least one UTF-8 byte, so a prompt whose byte length
+        fits the budget cannot exceed it and is not encoded at all.
+        """
+        if _tiktoken_encoding(model_name) is None:
+            return None
 
-            self._client = OpenAI(**client_kwargs)
+        try:
+            capabilities = self.get_capabilities(model_name)
+        except ValueError:
+            return None
+        if hasattr(capabilities, "_is_generic"):
+            return None
 
-        return self._client
+        budget = capabilities.context_window - (max_output_tokens or 0)
+        prompt_bytes = len(prompt.encode("utf-8"))
+        if system_prompt:
+            prompt_bytes += len(system_prompt.encode("utf-8"))
+        if prompt_bytes <= budget:
+            return None
+        return budget
 
-    def generate_content(
+    def _check_context_window(
+        self, prompt: str, model_name: str, system_prompt: Optional[str], max_output_tokens: Optional[int]
+    ) -> None:
+        """Fail fast if a prompt cannot fit in the model's context window.
+
+        Raises:
+            ValueError: If the prompt plus requested output exceeds the context window
+        """
+        budget = self._context_window_budget(prompt, model_name, system_prompt, max_output_tokens)
+        if budget is None:
+            return
+
+        encoding = _tiktoken_encoding(model_name)
+        prompt_tokens = len(encoding.encode(prompt))
+        if system_prompt:
+            prompt_tokens += len(encoding.encode(system_prompt))
+
+        if prompt_tokens > budget:
+            context_window = budget + (max_output_tokens or 0)
+            raise ValueError(
+                f"Prompt is {prompt_tokens:,} tokens but model {model_name} allows at most {budget:,} "
+                f"(context window {context_window:,}, max output {max_output_tokens or 0:,})"
+            )
+
+    def _build_completion_params(
         self,
         prompt: str,
         model_name: str,
@@ -230,19 +520,13 @@ class OpenAICompatibleProvider(ModelProvider):
         temperature: float = 0.7,
         max_output_tokens: Optional[int] = None,
         **kwargs,
-    ) -> ModelResponse:
-        """Generate content using the OpenAI-compatible API.
+    ) -> dict:
+        """Validate a request and build the chat completion parameters for it.
 
-        Args:
-            prompt: User prompt to send to the model
-            model_name: Name of the model to use
-            system_prompt: Optional system prompt for model behavior
-            temperature: Sampling temperature
-            max_output_tokens: Maximum tokens to generate
-            **kwargs: Additional provider-specific parameters
+        Shared by the sync and async generation paths so both send identical requests.
 
         Returns:
-            ModelResponse with generated content and metadata
+            Keyword arguments for ``chat.completions.create``
         """
         # Validate model name against allow-list
         if not self.validate_model_name(model_name):
@@ -269,31 +553,164 @@ class OpenAICompatibleProvider(ModelProvider):
             completion_params["max_tokens"] = max_output_tokens
 
         # Add any additional OpenAI-specific parameters
-        for key, value in kwargs.items():
-            if key in ["top_p", "frequency_penalty", "presence_penalty", "seed", "stop", "stream"]:
-                completion_params[key] = value
+        completion_params.update((key, kwargs[key]) for key in _FORWARDED_KWARGS & kwargs.keys())
+
+        return completion_params
+
+    def _response_cache_key(self, completion_params: dict) -> Optional[bytes]:
+        """Build a response cache key for a request, if its output is deterministic.
+
+        Only requests with temperature 0 or a fixed seed are cached, and never
+        streamed ones.
+
+        Returns:
+            Digest identifying the request, or None if it should not be cached
+        """
+        if self.response_cache is None or completion_params.get("stream"):
+            return None
+        if completion_params.get("temperature") != 0 and completion_params.get("seed") is None:
+            return None
+
+        # Responses depend on the account as well as the request, so keys never collide across credentials
+        payload = _json_dumps(
+            [
+                self.get_provider_type().value,
+                self.base_url,
+                self.organization,
+                _hash_api_key(self.api_key),
+                completion_params,
+            ],
+            sort_keys=True,
+        )
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _get_cached_response(self, cache_key: Optional[bytes]) -> Optional[ModelResponse]:
+        """Return a copy of a cached response, or None on a miss."""
+        if cache_key is None:
+            return None
+        with self._response_cache_lock:
+            cached = self.response_cache.get(cache_key)
+        if cached is None:
+            return None
+        logging.debug(f"{self.FRIENDLY_NAME} response cache hit for model {cached.model_name}")
+        return dataclasses.replace(cached, usage=dict(cached.usage), metadata=dict(cached.metadata))
+
+    def _store_cached_response(self, cache_key: Optional[bytes], response: ModelResponse) -> ModelResponse:
+        """Store a response under its cache key (if any) and return it."""
+        if cache_key is not None:
+            with self._response_cache_lock:
+                self.response_cache[cache_key] = dataclasses.replace(
+                    response, usage=dict(response.usage), metadata=dict(response.metadata)
+                )
+        return response
+
+    def _parse_response(self, response, model_name: str) -> ModelResponse:
+        """Convert a chat completion response into a ModelResponse."""
+        # Extract content and usage
+        choice = response.choices[0]
+        usage = self._extract_usage(response)
+
+        return ModelResponse(
+            content=choice.message.content,
+            usage=usage,
+            model_name=model_name,
+            friendly_name=self.FRIENDLY_NAME,
+            provider=self.get_provider_type(),
+            metadata={
+                "finish_reason": choice.finish_reason,
+                "model": response.model,  # Actual model used
+                "id": response.id,
+                "created": response.created,
+            },
+        )
+
+    def _parse_stream(self, stream, model_name: str) -> ModelResponse:
+        """Aggregate a streamed chat completion into a single ModelResponse.
+
+        Content deltas are collected in a list and joined once at the end, so long
+        streams stay linear in the size of the response.
+        """
+        parts: list[str] = []
+        finish_reason = model = response_id = created = None
+        usage = {}
+
+        for chunk in stream:
+            choices = chunk.choices
+            if choices:
+                choice = choices[0]
+                delta = choice.delta.content if choice.delta else None
+                if delta is not None:
+                    parts.append(delta)
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+            # Stream metadata is the same on every chunk; only read it until it is known
+            if model is None and chunk.model:
+                model = chunk.model
+            if response_id is None and chunk.id:
+                response_id = chunk.id
+            if created is None and chunk.created:
+                created = chunk.created
+            if getattr(chunk, "usage", None):
+                usage = self._extract_usage(chunk)
+
+        return ModelResponse(
+            content="".join(parts),
+            usage=usage,
+            model_name=model_name,
+            friendly_name=self.FRIENDLY_NAME,
+            provider=self.get_provider_type(),
+            metadata={
+                "finish_reason": finish_reason,
+                "model": model,  # Actual model used
+                "id": response_id,
+                "created": created,
+            },
+        )
+
+    def generate_content(
+        self,
+        prompt: str,
+        model_name: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_output_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> ModelResponse:
+        """Generate content using the OpenAI-compatible API.
+
+        Args:
+            prompt: User prompt to send to the model
+            model_name: Name of the model to use
+            system_prompt: Optional system prompt for model behavior
+            temperature: Sampling temperature
+            max_output_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            ModelResponse with generated content and metadata
+        """
+        # Resolve model alias to actual model name
+        model_name = self._resolve_model_name(model_name)
+
+        completion_params = self._build_completion_params(
+            prompt, model_name, system_prompt, temperature, max_output_tokens, **kwargs
+        )
+
+        # Deterministic requests may be answered from the response cache
+        cache_key = self._response_cache_key(completion_params)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        # Reject prompts that cannot fit before paying for a round-trip
+        self._check_context_window(prompt, model_name, system_prompt, max_output_tokens)
 
         try:
             # Generate completion
             response = self.client.chat.completions.create(**completion_params)
-
-            # Extract content and usage
-            content = response.choices[0].message.content
-            usage = self._extract_usage(response)
-
-            return ModelResponse(
-                content=content,
-                usage=usage,
-                model_name=model_name,
-                friendly_name=self.FRIENDLY_NAME,
-                provider=self.get_provider_type(),
-                metadata={
-                    "finish_reason": response.choices[0].finish_reason,
-                    "model": response.model,  # Actual model used
-                    "id": response.id,
-                    "created": response.created,
-                },
-            )
+            if completion_params.get("stream"):
+                return self._parse_stream(response, model_name)
+            return self._store_cached_response(cache_key, self._parse_response(response, model_name))
 
         except Exception as e:
             # Log error and re-raise with more context
@@ -301,6 +718,128 @@ class OpenAICompatibleProvider(ModelProvider):
             logging.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    async def generate_content_async(
+        self,
+        prompt: str,
+        model_name: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_output_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> ModelResponse:
+        """Generate content without blocking the event loop.
+
+        Takes the same arguments as generate_content but awaits the async client,
+        so several requests can be in flight at once.
+
+        Returns:
+            ModelResponse with generated content and metadata
+        """
+        # Resolve model alias to actual model name
+        model_name = self._resolve_model_name(model_name)
+
+        completion_params = self._build_completion_params(
+            prompt, model_name, system_prompt, temperature, max_output_tokens, **kwargs
+        )
+
+        cache_key = self._response_cache_key(completion_params)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        # Tokenizing a large prompt is CPU-bound, so keep it off the event loop
+        if self._context_window_budget(prompt, model_name, system_prompt, max_output_tokens) is not None:
+            await asyncio.to_thread(self._check_context_window, prompt, model_name, system_prompt, max_output_tokens)
+
+        try:
+            response = await self.async_client.chat.completions.create(**completion_params)
+            if completion_params.get("stream"):
+                chunks = [chunk async for chunk in response]
+                return self._parse_stream(chunks, model_name)
+            return self._store_cached_response(cache_key, self._parse_response(response, model_name))
+
+        except Exception as e:
+            error_msg = f"{self.FRIENDLY_NAME} API error for model {model_name}: {str(e)}"
+            logging.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    async def generate_many(self, requests: list[dict], max_concurrency: int = 10) -> list:
+        """Dispatch several generation requests concurrently.
+
+        Network latency overlaps across requests, so N prompts take roughly one
+        round-trip instead of N (up to the concurrency cap).
+
+        Args:
+            requests: List of keyword-argument dicts for generate_content_async
+                (each must include at least ``prompt`` and ``model_name``)
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List in the same order as ``requests``, holding a ModelResponse for each
+            successful request or the raised exception for each failed one
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(request: dict) -> ModelResponse:
+            async with semaphore:
+                return await self.generate_content_async(**request)
+
+        return await asyncio.gather(*(_run(request) for request in requests), return_exceptions=True)
+
+    async def generate_batch(
+        self,
+        prompts: list[str],
+        model_name: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_output_tokens: Optional[int] = None,
+        max_concurrency: int = 10,
+        **kwargs,
+    ) -> list[ModelResponse]:
+        """Generate completions for several prompts sharing the same settings.
+
+        Chat completion endpoints accept one conversation per request, so the prompts
+        are fanned out concurrently through generate_many rather than sent as a
+        single legacy ``completions`` batch.
+
+        Args:
+            prompts: User prompts to send
+            model_name: Name of the model to use for every prompt
+            system_prompt: Optional system prompt applied to every prompt
+            temperature: Sampling temperature
+            max_output_tokens: Maximum tokens to generate per prompt
+            max_concurrency: Maximum number of requests in flight at once
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            ModelResponses in the same order as ``prompts``
+
+        Raises:
+            ValueError: If a request failed validation before being sent (model not
+                allowed, invalid parameters, prompt exceeding the context window)
+            RuntimeError: If a request failed at the API
+
+            In both cases the first failure is raised once all requests have finished.
+        """
+        requests = [
+            {
+                "prompt": prompt,
+                "model_name": model_name,
+                "system_prompt": system_prompt,
+                "temperature": temperature,
+                "max_output_tokens": max_output_tokens,
+                **kwargs,
+            }
+            for prompt in prompts
+        ]
+        results = await self.generate_many(requests, max_concurrency=max_concurrency)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return results
+
     def count_tokens(self, text: str, model_name: str) -> int:
         """Count tokens for the given text.
 
@@ -323,24 +862,15 @@ class OpenAICompatibleProvider(ModelProvider):
             except Exception as e:
                 logging.debug(f"Remote token counting failed: {e}")
 
-        # 2. Try tiktoken for known models
-        try:
-            import tiktoken
-
-            # Try to get encoding for the specific model
+        # 2. Try tiktoken for known models, defaulting to cl100k_base
+        encoding = _tiktoken_encoding(model_name) or _default_tiktoken_encoding()
+        if encoding is not None:
             try:
-                encoding = tiktoken.encoding_for_model(model_name)
-            except KeyError:
-                # Try common encodings based on model patterns
-                if "gpt-4" in model_name or "gpt-3.5" in model_name:
-                    encoding = tiktoken.get_encoding("cl100k_base")
-                else:
-                    encoding = tiktoken.get_encoding("cl100k_base")  # Default
-
-            return len(encoding.encode(text))
-
-        except (ImportError, Exception) as e:
-            logging.debug(f"Tiktoken not available or failed: {e}")
+                return len(encoding.encode(text))
+            except Exception as e:
+                logging.debug(f"Tiktoken failed: {e}")
+        else:
+            logging.debug("Tiktoken not available")
 
         # 3. Fall back to character-based estimation
         logging.warning(
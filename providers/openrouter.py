@@ -6,7 +6,6 @@ from typing import Optional
 
 from .base import (
     ModelCapabilities,
-    ModelResponse,
     ProviderType,
     RangeTemperatureConstraint,
 )
@@ -143,41 +142,6 @@ class OpenRouterProvider(OpenAICompatibleProvider):
         # Higher priority providers (native APIs, custom endpoints) get first chance
         return True
 
-    def generate_content(
-        self,
-        prompt: str,
-        model_name: str,
-        system_prompt: Optional[str] = None,
-        temperature: float = 0.7,
-        max_output_tokens: Optional[int] = None,
-        **kwargs,
-    ) -> ModelResponse:
-        """Generate content using the OpenRouter API.
-
-        Args:
-            prompt: User prompt to send to the model
-            model_name: Name of the model (or alias) to use
-            system_prompt: Optional system prompt for model behavior
-            temperature: Sampling temperature
-            max_output_tokens: Maximum tokens to generate
-            **kwargs: Additional provider-specific parameters
-
-        Returns:
-            ModelResponse with generated content and metadata
-        """
-        # Resolve model alias to actual OpenRouter model name
-        resolved_model = self._resolve_model_name(model_name)
-
-        # Call parent method with resolved model name
-        return super().generate_content(
-            prompt=prompt,
-            model_name=resolved_model,
-            system_prompt=system_prompt,
-            temperature=temperature,
-            max_output_tokens=max_output_tokens,
-            **kwargs,
-        )
-
     def supports_thinking_mode(self, model_name: str) -> bool:
         """Check if the model supports extended thinking mode.
 
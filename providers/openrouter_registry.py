@@ -12,9 +12,12 @@ from utils.file_utils import translate_path_for_environment
 from .base import ModelCapabilities, ProviderType, RangeTemperatureConstraint
 
 
-@dataclass
+@dataclass(frozen=True)
 class OpenRouterModelConfig:
-    """Configuration for an OpenRouter model."""
+    """Configuration for an OpenRouter model.
+
+    Frozen because a single instance is shared by every lookup through the registry.
+    """
 
     model_name: str
     aliases: list[str] = field(default_factory=list)
@@ -53,6 +56,7 @@ class OpenRouterModelRegistry:
         """
         self.alias_map: dict[str, str] = {}  # alias -> model_name
         self.model_map: dict[str, OpenRouterModelConfig] = {}  # model_name -> config
+        self.capabilities_map: dict[str, ModelCapabilities] = {}  # model_name -> capabilities
 
         # Determine config path
         if config_path:
@@ -85,6 +89,7 @@ class OpenRouterModelRegistry:
             # Initialize with empty maps on failure
             self.alias_map = {}
             self.model_map = {}
+            self.capabilities_map = {}
             if "Duplicate alias" in str(e):
                 raise
         except Exception as e:
@@ -92,6 +97,7 @@ class OpenRouterModelRegistry:
             # Initialize with empty maps on failure
             self.alias_map = {}
             self.model_map = {}
+            self.capabilities_map = {}
 
     def _read_config(self) -> list[OpenRouterModelConfig]:
         """Read configuration from file.
@@ -158,9 +164,12 @@ class OpenRouterModelRegistry:
                     )
                 alias_map[alias_lower] = config.model_name
 
+        capabilities_map = {name: config.to_capabilities() for name, config in model_map.items()}
+
         # Atomic update
         self.alias_map = alias_map
         self.model_map = model_map
+        self.capabilities_map = capabilities_map
 
     def resolve(self, name_or_alias: str) -> Optional[OpenRouterModelConfig]:
         """Resolve a model name or alias to configuration.
@@ -186,11 +195,12 @@ class OpenRouterModelRegistry:
             name_or_alias: Model name or alias
 
         Returns:
-            ModelCapabilities if found, None otherwise
+            ModelCapabilities if found, None otherwise. The instance is shared between
+            lookups and must not be mutated.
         """
         config = self.resolve(name_or_alias)
         if config:
-            return config.to_capabilities()
+            return self.capabilities_map.get(config.model_name)
         return None
 
     def list_models(self) -> list[str]:
@@ -52,6 +52,9 @@ class TestCustomProvider:
         assert capabilities.provider == ProviderType.CUSTOM
         assert capabilities.context_window > 0
 
+        # The shared registry entry keeps its OpenRouter provider type
+        assert provider._registry.get_capabilities("llama").provider == ProviderType.OPENROUTER
+
     def test_get_capabilities_generic_fallback(self):
         """Test get_capabilities returns generic capabilities for unknown models."""
         provider = CustomProvider(api_key="test-key", base_url="http://localhost:11434/v1")
@@ -85,27 +88,22 @@ class TestCustomProvider:
         assert not provider.supports_thinking_mode("llama3.2")
         assert not provider.supports_thinking_mode("any-model")
 
-    @patch("providers.custom.OpenAICompatibleProvider.generate_content")
-    def test_generate_content_with_alias_resolution(self, mock_generate):
-        """Test generate_content resolves aliases before calling parent."""
-        mock_response = MagicMock()
-        mock_generate.return_value = mock_response
-
+    def test_generate_content_with_alias_resolution(self):
+        """Test generate_content resolves aliases before calling the API."""
         provider = CustomProvider(api_key="test-key", base_url="http://localhost:11434/v1")
+        provider._client = MagicMock()
 
         # Call with an alias
         result = provider.generate_content(
             prompt="test prompt",
-            model_name="llama",
-            temperature=0.7,  # This is an alias
+            model_name="local-llama",  # This is an alias
+            temperature=0.7,
         )
 
-        # Verify parent method was called with resolved model name
-        mock_generate.assert_called_once()
-        call_args = mock_generate.call_args
-        # The model_name should be either resolved or passed through
-        assert "model_name" in call_args.kwargs
-        assert result == mock_response
+        # Verify the API was called with the resolved model name
+        call_args = provider._client.chat.completions.create.call_args
+        assert call_args.kwargs["model"] == "llama3.2"
+        assert result.model_name == "llama3.2"
 
 
 class TestCustomProviderRegistration:
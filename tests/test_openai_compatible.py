@@ -0,0 +1,464 @@
+"""Tests for the shared OpenAI-compatible provider base class."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from providers.base import ModelResponse
+from providers.openai import OpenAIModelProvider
+
+
+def _mock_completion(content: str = "Generated content"):
+    """Build a mock chat completion response."""
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = content
+    response.choices[0].finish_reason = "stop"
+    response.model = "o3-mini"
+    response.id = "chatcmpl-123"
+    response.created = 1234567890
+    response.usage.prompt_tokens = 10
+    response.usage.completion_tokens = 20
+    response.usage.total_tokens = 30
+    return response
+
+
+def _mock_chunk(content=None, finish_reason=None):
+    """Build a mock streamed chat completion chunk."""
+    chunk = Mock()
+    chunk.choices = [Mock()]
+    chunk.choices[0].delta.content = content
+    chunk.choices[0].finish_reason = finish_reason
+    chunk.model = "o3-mini"
+    chunk.id = "chatcmpl-123"
+    chunk.created = 1234567890
+    chunk.usage = None
+    return chunk
+
+
+def _use_async_client(provider, client):
+    """Install a mock async client for the currently running event loop."""
+    provider._async_client = client
+    provider._async_client_loop = asyncio.get_running_loop()
+
+
+class TestStreaming:
+    """Test aggregation of streamed responses"""
+
+    def test_streamed_content_is_aggregated(self):
+        """Test stream=True joins the chunk deltas into one response"""
+        provider = OpenAIModelProvider(api_key="test-key")
+        provider._client = Mock()
+        provider._client.chat.completions.create.return_value = iter(
+            [_mock_chunk("Hello"), _mock_chunk(None), _mock_chunk(", world"), _mock_chunk(None, "stop")]
+        )
+
+        response = provider.generate_content("Test prompt", "o3-mini", temperature=1.0, stream=True)
+
+        assert response.content == "Hello, world"
+        assert response.metadata["finish_reason"] == "stop"
+        assert response.metadata["id"] == "chatcmpl-123"
+        assert provider._client.chat.completions.create.call_args.kwargs["stream"] is True
+
+
+class TestAsyncGeneration:
+    """Test the async generation path"""
+
+    @pytest.mark.asyncio
+    async def test_generate_content_async(self):
+        """Test async generation builds the same request as the sync path"""
+        provider = OpenAIModelProvider(api_key="test-key")
+        _use_async_client(provider, Mock())
+        provider._async_client.chat.completions.create = AsyncMock(return_value=_mock_completion())
+
+        response = await provider.generate_content_async(
+            prompt="Test prompt", model_name="o3-mini", system_prompt="Be brief", temperature=1.0
+        )
+
+        assert isinstance(response, ModelResponse)
+        assert response.content == "Generated content"
+        assert response.usage["total_tokens"] == 30
+
+        call_kwargs = provider._async_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["model"] == "o3-mini"
+        assert call_kwargs["messages"] == [
+            {"role": "system", "content": "Be brief"},
+            {"role": "user", "content": "Test prompt"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_generate_many_preserves_order_and_errors(self):
+        """Test concurrent dispatch returns results in request order with failures in place"""
+        provider = OpenAIModelProvider(api_key="test-key")
+        _use_async_client(provider, Mock())
+        provider._async_client.chat.completions.create = AsyncMock(
+            side_effect=[_mock_completion("first"), Exception("boom"), _mock_completion("third")]
+        )
+
+        results = await provider.generate_many(
+            [{"prompt": f"Prompt {i}", "model_name": "o3-mini", "temperature": 1.0} for i in range(3)],
+            max_concurrency=1,
+        )
+
+        assert len(results) == 3
+        assert results[0].content == "first"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2].content == "third"
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_returns_responses_in_order(self):
+        """Test batch generation fans prompts out and keeps their order"""
+        provider = OpenAIModelProvider(api_key="test-key")
+        _use_async_client(provider, Mock())
+        provider._async_client.chat.completions.create = AsyncMock(
+            side_effect=[_mock_completion("a"), _mock_completion("b")]
+        )
+
+        responses = await provider.generate_batch(["first", "second"], "o3-mini", temperature=1.0)
+
+        assert [response.content for response in responses] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_raises_on_failure(self):
+        """Test batch generation surfaces a failed request"""
+        provider = OpenAIModelProvider(api_key="test-key")
+        _use_async_client(provider, Mock())
+        provider._async_client.chat.completions.create = AsyncMock(side_effect=Exception("boom"))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await provider.generate_batch(["first"], "o3-mini", temperature=1.0)
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_raises_validation_errors(self):
+        """Test batch generation surfaces requests rejected before sending as ValueError"""
+        provider = OpenAIModelProvider(api_key="test-key")
+        _use_async_client(provider, Mock())
+        provider._async_client.chat.completions.create = AsyncMock(return_value=_mock_completion())
+
+        with pytest.raises(ValueError, match="not in allowed models list"):
+            await provider.generate_batch(["first"], "gpt-4o", temperature=1.0)
+
+    def test_async_client_survives_multiple_event_loops(self):
+        """Test repeated asyncio.run calls each get a client bound to their own loop"""
+        completion = {
+            "id": "chatcmpl-1",
+            "object": "chat.completion",
+            "created": 1234567890,
+            "model": "o3-mini",
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "hi"}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, so the client pools the connection
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                body = json.dumps(completion).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            provider = OpenAIModelProvider(api_key="test-key", base_url=f"http://127.0.0.1:{server.server_port}/v1")
+
+            for _ in range(2):
+                response = asyncio.run(provider.generate_content_async("Test prompt", "o3-mini", temperature=1.0))
+                assert response.content == "hi"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_async_client(self):
+        """Test aclose releases the async client so the next request builds a fresh one"""
+        provider = OpenAIModelProvider(api_key="test-key")
+        client = provider.async_client
+
+        await provider.aclose()
+
+        assert client.is_closed()
+        assert provider.async_client is not client
+        await provider.aclose()
+
+
+class TestClientCache:
+    """Test the process-wide sync client cache"""
+
+    def test_providers_with_same_settings_share_client(self):
+        """Test re-instantiated providers reuse the same client and connection pool"""
+        first = OpenAIModelProvider(api_key="shared-key")
+        second = OpenAIModelProvider(api_key="shared-key")
+
+        assert first.client is second.client
+
+    def test_different_credentials_get_separate_clients(self):
+        """Test clients are not shared across API keys"""
+        first = OpenAIModelProvider(api_key="key-one")
+        second = OpenAIModelProvider(api_key="key-two")
+
+        assert first.client is not second.client
+        assert second.client.api_key == "key-two"
+
+    def test_retry_budget_is_configurable(self):
+        """Test the configured retry budget is applied to both clients"""
+        provider = OpenAIModelProvider(api_key="test-key", max_retries=5)
+
+        assert OpenAIModelProvider(api_key="test-key").client.max_retries == 2
+        assert provider.client.max_retries == 5
+        assert provider.async_client.max_retries == 5
+
+
+class TestConnectionWarmup:
+    """Test the optional background connection warm-up"""
+
+    def test_warmup_disabled_by_default(self):
+        """Test no background thread is started unless requested"""
+        with patch.object(OpenAIModelProvider, "_warm_connection") as mock_warm:
+            OpenAIModelProvider(api_key="test-key")
+
+        mock_warm.assert_not_called()
+
+    def test_warmup_lists_models(self):
+        """Test warm-up issues a cheap models.list call and swallows failures"""
+        provider = OpenAIModelProvider(api_key="test-key")
+        provider._client = Mock()
+        provider._client.with_options.return_value.models.list.side_effect = Exception("offline")
+
+        provider._warm_connection()
+
+        provider._client.with_options.assert_called_once_with(timeout=2.0)
+
+
+class TestCompletionParams:
+    """Test chat completion parameter construction"""
+
+    def test_only_supported_kwargs_are_forwarded(self):
+        """Test known sampling kwargs pass through and unknown ones are dropped"""
+        provider = OpenAIModelProvider(api_key="test-key")
+
+        params = provider._build_completion_params(
+            "Test prompt", "o3-mini", temperature=1.0, top_p=0.9, seed=42, thinking_mode="high"
+        )
+
+        assert params["top_p"] == 0.9
+        assert params["seed"] == 42
+        assert "thinking_mode" not in params
+
+
+class TestHttp2:
+    """Test optional HTTP/2 configuration"""
+
+    def test_http2_disabled_by_default(self):
+        """Test providers use HTTP/1.1 unless HTTP/2 is requested"""
+        provider = OpenAIModelProvider(api_key="test-key")
+
+        assert provider.http2 is False
+
+    def test_http2_falls_back_without_h2(self):
+        """Test requesting HTTP/2 without h2 installed falls back to HTTP/1.1"""
+        with patch("providers.openai_compatible._http2_available", return_value=False):
+            provider = OpenAIModelProvider(api_key="test-key", http2=True)
+
+        assert provider.http2 is False
+
+    def test_http2_client_is_shared(self):
+        """Test HTTP/2 providers share one multiplexed client"""
+        created = []
+
+        class RecordingClient(httpx.Client):
+            def __init__(self, **kwargs):
+                # h2 may not be installed in the test environment
+                if kwargs.pop("http2", False):
+                    created.append(kwargs)
+                super().__init__(**kwargs)
+
+        with patch("providers.openai_compatible._http2_available", return_value=True):
+            first = OpenAIModelProvider(api_key="http2-key", http2="true")
+            second = OpenAIModelProvider(api_key="http2-key", http2=True)
+
+        with patch("providers.openai_compatible.httpx.Client", RecordingClient):
+            assert first.client is second.client
+
+        assert len(created) == 1
+
+
+class TestResponseCache:
+    """Test the optional response cache for deterministic requests"""
+
+    def _provider(self, cache):
+        """Create a provider with a mocked client and the given cache."""
+        provider = OpenAIModelProvider(api_key="test-key", cache=cache)
+        provider._client = Mock()
+        provider._client.chat.completions.create.return_value = _mock_completion()
+        return provider
+
+    def test_seeded_requests_are_cached(self):
+        """Test a repeated request with a fixed seed is served from the cache"""
+        cache = {}
+        provider = self._provider(cache)
+
+        first = provider.generate_content("Test prompt", "o3-mini", temperature=1.0, seed=7)
+        second = provider.generate_content("Test prompt", "o3-mini", temperature=1.0, seed=7)
+
+        assert provider._client.chat.completions.create.call_count == 1
+        assert len(cache) == 1
+        assert second.content == first.content
+        assert second is not first
+
+    def test_sampled_requests_are_not_cached(self):
+        """Test requests without a fixed seed or zero temperature always hit the API"""
+        cache = {}
+        provider = self._provider(cache)
+
+        provider.generate_content("Test prompt", "o3-mini", temperature=1.0)
+        provider.generate_content("Test prompt", "o3-mini", temperature=1.0)
+
+        assert provider._client.chat.completions.create.call_count == 2
+        assert cache == {}
+
+    def test_different_prompts_use_different_entries(self):
+        """Test the cache key covers the request contents"""
+        cache = {}
+        provider = self._provider(cache)
+
+        provider.generate_content("First", "o3-mini", temperature=1.0, seed=7)
+        provider.generate_content("Second", "o3-mini", temperature=1.0, seed=7)
+
+        assert provider._client.chat.completions.create.call_count == 2
+        assert len(cache) == 2
+
+    def test_shared_cache_is_partitioned_by_credentials(self):
+        """Test providers with different API keys or organizations never share entries"""
+        cache = {}
+        providers = [
+            OpenAIModelProvider(api_key="key-a", cache=cache),
+            OpenAIModelProvider(api_key="key-b", cache=cache),
+            OpenAIModelProvider(api_key="key-a", organization="org-1", cache=cache),
+        ]
+        for provider in providers:
+            provider._client = Mock()
+            provider._client.chat.completions.create.return_value = _mock_completion()
+            provider.generate_content("Test prompt", "o3-mini", temperature=1.0, seed=7)
+
+        assert all(provider._client.chat.completions.create.call_count == 1 for provider in providers)
+        assert len(cache) == 3
+
+
+class TestContextWindowCheck:
+    """Test the pre-flight context window check"""
+
+    def test_oversized_prompt_rejected_before_request(self):
+        """Test prompts that cannot fit are rejected without calling the API"""
+        provider = OpenAIModelProvider(api_key="test-key")
+        provider._client = Mock()
+        encoding = Mock()
+        encoding.encode.side_effect = lambda text: text.split()
+
+        with patch("providers.openai_compatible._tiktoken_encoding", return_value=encoding):
+            with pytest.raises(ValueError, match="allows at most"):
+                provider.generate_content("word " * 150_000, "o3-mini", temperature=1.0, max_output_tokens=100_000)
+
+        provider._client.chat.completions.create.assert_not_called()
+
+    def test_check_skipped_without_exact_tokenizer(self):
+        """Test no check is made when the model's tokenizer is unknown"""
+        provider = OpenAIModelProvider(api_key="test-key")
+
+        with patch("providers.openai_compatible._tiktoken_encoding", return_value=None):
+            provider._check_context_window("word " * 300_000, "o3-mini", None, None)
+
+    def test_small_prompt_is_not_tokenized(self):
+        """Test prompts whose byte length fits the budget skip tokenization"""
+        provider = OpenAIModelProvider(api_key="test-key")
+        encoding = Mock()
+
+        with patch("providers.openai_compatible._tiktoken_encoding", return_value=encoding):
+            provider._check_context_window("Test prompt", "o3-mini", "You are helpful", 1000)
+
+        encoding.encode.assert_not_called()
+
+    def test_cached_response_skips_check(self):
+        """Test a response cache hit is returned without tokenizing the prompt again"""
+        provider = OpenAIModelProvider(api_key="test-key", cache={})
+        provider._client = Mock()
+        provider._client.chat.completions.create.return_value = _mock_completion()
+        encoding = Mock()
+        encoding.encode.side_effect = lambda text: text.split()
+        prompt = "word " * 50_000
+
+        with patch("providers.openai_compatible._tiktoken_encoding", return_value=encoding):
+            provider.generate_content(prompt, "o3-mini", temperature=1.0, seed=7)
+            asyncio.run(provider.generate_content_async(prompt, "o3-mini", temperature=1.0, seed=7))
+
+        assert provider._client.chat.completions.create.call_count == 1
+        assert encoding.encode.call_count == 1
+
+    def test_encoding_load_failure_skips_check(self):
+        """Test a failed tokenizer download skips the check and still sends the request"""
+        from providers import openai_compatible
+
+        tiktoken = Mock()
+        tiktoken.encoding_for_model.side_effect = ConnectionError("download failed")
+        tiktoken.get_encoding.side_effect = ConnectionError("download failed")
+
+        provider = OpenAIModelProvider(api_key="test-key")
+        provider._client = Mock()
+        provider._client.chat.completions.create.return_value = _mock_completion()
+
+        openai_compatible._tiktoken_encoding.cache_clear()
+        openai_compatible._default_tiktoken_encoding.cache_clear()
+        try:
+            with patch("providers.openai_compatible._tiktoken", return_value=tiktoken):
+                first = provider.generate_content("Test prompt", "o3-mini", temperature=1.0)
+                second = provider.generate_content("Test prompt", "o3-mini", temperature=1.0)
+                token_count = provider.count_tokens("abcdefgh", "o3-mini")
+        finally:
+            openai_compatible._tiktoken_encoding.cache_clear()
+            openai_compatible._default_tiktoken_encoding.cache_clear()
+
+        assert first.content == second.content == "Generated content"
+        assert provider._client.chat.completions.create.call_count == 2
+        # The failed load is cached rather than retried on every request
+        assert tiktoken.encoding_for_model.call_count == 1
+        assert token_count == 2
+
+
+class TestHttp2AsyncClient:
+    """Test the HTTP/2 async client follows the running event loop"""
+
+    def test_http2_async_client_rebuilt_per_event_loop(self):
+        """Test each event loop gets its own multiplexed async connection pool"""
+        created = []
+
+        class RecordingAsyncClient(httpx.AsyncClient):
+            def __init__(self, **kwargs):
+                # h2 may not be installed in the test environment
+                if kwargs.pop("http2", False):
+                    created.append(kwargs)
+                super().__init__(**kwargs)
+
+        with patch("providers.openai_compatible._http2_available", return_value=True):
+            provider = OpenAIModelProvider(api_key="test-key", http2=True)
+
+        async def get_client():
+            return provider.async_client
+
+        with patch("providers.openai_compatible.httpx.AsyncClient", RecordingAsyncClient):
+            first = asyncio.run(get_client())
+            second = asyncio.run(get_client())
+
+        assert first is not second
+        assert len(created) == 2
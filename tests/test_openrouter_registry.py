@@ -3,6 +3,7 @@
 import json
 import os
 import tempfile
+from dataclasses import FrozenInstanceError
 
 import pytest
 
@@ -218,3 +219,18 @@ class TestOpenRouterModelRegistry:
         assert caps.supports_streaming
         assert caps.supports_function_calling
         # Note: supports_json_mode is not in ModelCapabilities yet
+
+    def test_model_config_is_immutable(self):
+        """Test shared model configs cannot be mutated by callers."""
+        config = OpenRouterModelConfig(model_name="test/model")
+
+        with pytest.raises(FrozenInstanceError):
+            config.context_window = 1
+
+    def test_capabilities_are_cached(self):
+        """Test capabilities are built once per model and shared between lookups."""
+        registry = OpenRouterModelRegistry()
+
+        caps = registry.get_capabilities("opus")
+        assert caps is registry.get_capabilities("anthropic/claude-3-opus")
+        assert caps.provider == ProviderType.OPENROUTER
@@ -1,8 +1,11 @@
 """Tests for the model provider abstraction system"""
 
+import json
 import os
 from unittest.mock import Mock, patch
 
+import pytest
+
 from providers import ModelProviderRegistry, ModelResponse
 from providers.base import ProviderType
 from providers.gemini import GeminiModelProvider
@@ -180,6 +183,14 @@ class TestOpenAIProvider:
         assert capabilities.context_window == 200_000
         assert not capabilities.supports_extended_thinking
 
+    def test_capabilities_are_cached(self):
+        """Test capabilities are built once and unknown models are rejected"""
+        provider = OpenAIModelProvider(api_key="test-key")
+
+        assert provider.get_capabilities("o3") is provider.get_capabilities("o3")
+        with pytest.raises(ValueError, match="Unsupported OpenAI model"):
+            provider.get_capabilities("gpt-4o")
+
     def test_validate_model_names(self):
         """Test model name validation"""
         provider = OpenAIModelProvider(api_key="test-key")
@@ -195,3 +206,98 @@ class TestOpenAIProvider:
 
         assert not provider.supports_thinking_mode("o3")
         assert not provider.supports_thinking_mode("o3-mini")
+
+    def test_submit_batch_uploads_jsonl(self):
+        """Test batch submission uploads one chat completion request per line"""
+        provider = OpenAIModelProvider(api_key="test-key")
+        provider._client = Mock()
+        provider._client.files.create.return_value.id = "file-123"
+        provider._client.batches.create.return_value.id = "batch-123"
+
+        batch_id = provider.submit_batch(
+            [
+                {"custom_id": "a", "prompt": "First", "model_name": "o3-mini", "temperature": 1.0},
+                {"prompt": "Second", "model_name": "o3-mini", "temperature": 1.0},
+            ]
+        )
+
+        assert batch_id == "batch-123"
+        uploaded = provider._client.files.create.call_args.kwargs["file"][1].getvalue().decode()
+        lines = [json.loads(line) for line in uploaded.splitlines()]
+        assert [line["custom_id"] for line in lines] == ["a", "1"]
+        assert lines[0]["url"] == "/v1/chat/completions"
+        assert lines[0]["body"]["messages"] == [{"role": "user", "content": "First"}]
+        provider._client.batches.create.assert_called_once_with(
+            input_file_id="file-123",
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            metadata={"model": "o3-mini"},
+        )
+
+    def test_retrieve_batch_results(self):
+        """Test batch results are parsed into ModelResponses keyed by custom_id"""
+        provider = OpenAIModelProvider(api_key="test-key")
+        provider._client = Mock()
+        batch = Mock(
+            status="completed", input_file_id="file-in", output_file_id="file-out", error_file_id=None, metadata=None
+        )
+        provider._client.batches.retrieve.return_value = batch
+        completion = {
+            "id": "chatcmpl-1",
+            "object": "chat.completion",
+            "created": 1234567890,
+            "model": "o3-mini-2025-01-31",
+            "choices": [
+                {"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "Done"}},
+            ],
+            "usage": {"prompt_tokens": 5, "completion_tokens": 7, "total_tokens": 12},
+        }
+        records = [
+            {"custom_id": "a", "response": {"status_code": 200, "body": completion}, "error": None},
+            {"custom_id": "b", "response": {"status_code": 400, "body": {"error": "bad"}}, "error": None},
+        ]
+        inputs = [
+            {"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": {"model": "o3-mini"}}
+            for custom_id in ("a", "b")
+        ]
+        files = {"file-in": inputs, "file-out": records}
+        provider._client.files.content.side_effect = lambda file_id: Mock(
+            content="\n".join(json.dumps(r) for r in files[file_id]).encode()
+        )
+
+        results = provider.retrieve_batch_results("batch-123")
+
+        assert isinstance(results["a"], ModelResponse)
+        assert results["a"].content == "Done"
+        assert results["a"].usage["total_tokens"] == 12
+        assert results["a"].model_name == "o3-mini"
+        assert results["a"].metadata["model"] == "o3-mini-2025-01-31"
+        assert results["b"] == {"error": "bad"}
+
+    def test_retrieve_single_model_batch_skips_input_file(self):
+        """Test batches with one model take it from their metadata instead of the input file"""
+        provider = OpenAIModelProvider(api_key="test-key")
+        provider._client = Mock()
+        provider._client.batches.retrieve.return_value = Mock(
+            status="completed",
+            input_file_id="file-in",
+            output_file_id="file-out",
+            error_file_id=None,
+            metadata={"model": "o3-mini"},
+        )
+        completion = {
+            "id": "chatcmpl-1",
+            "object": "chat.completion",
+            "created": 1234567890,
+            "model": "o3-mini-2025-01-31",
+            "choices": [
+                {"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "Done"}},
+            ],
+        }
+        record = {"custom_id": "a", "response": {"status_code": 200, "body": completion}, "error": None}
+        provider._client.files.content.return_value = Mock(content=json.dumps(record).encode())
+
+        results = provider.retrieve_batch_results("batch-123")
+
+        assert results["a"].model_name == "o3-mini"
+        provider._client.files.content.assert_called_once_with("file-out")